@@ -18,11 +18,47 @@ Main Features
 """
 
 import importlib
-
-from pysatMissions import instruments
-from pysatMissions import methods
-from pysatMissions import utils
+from importlib import metadata
 
 __all__ = ['instruments', 'methods', 'utils']
 
-__version__ = importlib.metadata.version('pysatMissions')
+__version__ = metadata.version('pysatMissions')
+
+
+def __getattr__(name):
+    """Import the subpackages on first access.
+
+    Parameters
+    ----------
+    name : str
+        Name of the requested attribute
+
+    Returns
+    -------
+    module
+        The requested subpackage
+
+    Raises
+    ------
+    AttributeError
+        If `name` is not a subpackage of pysatMissions
+
+    Note
+    ----
+    Deferring these imports avoids loading the propagation and coordinate
+    libraries until they are needed.  Once imported, the subpackage is set as
+    an attribute of this package, so this is only called once per name.
+
+    """
+
+    if name in __all__:
+        return importlib.import_module('.'.join((__name__, name)))
+
+    raise AttributeError("module {:} has no attribute {:}".format(
+        repr(__name__), repr(name)))
+
+
+def __dir__():
+    """List the module attributes, including deferred subpackages."""
+
+    return sorted(set(globals()) | set(__all__))
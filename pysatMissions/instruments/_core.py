@@ -6,6 +6,11 @@
 # ----------------------------------------------------------------------------
 """Handles the default pysat functions for simulated instruments."""
 
+import datetime as dt
+import numpy as np
+import os
+import pandas as pds
+
 
 def _clean(self):
     """Pass through since cleaning is not needed.
@@ -17,3 +22,87 @@ def _clean(self):
     """
 
     return
+
+
+def _generate_times(fnames, num_samples, cadence='1S'):
+    """Construct the times for simulated instruments from the file names.
+
+    Parameters
+    ----------
+    fnames : list
+        List of filenames.
+    num_samples : int
+        Maximum number of times to generate per file.  Data points will not go
+        beyond the current day.
+    cadence : str
+        Frequency of temporal output, compatible with pandas.date_range
+        (default='1S')
+
+    Returns
+    -------
+    uts : np.array
+        Array of seconds since the start of the first day for each time
+    index : pds.DatetimeIndex
+        The DatetimeIndex to be used in the simulated instrument objects
+    dates : list
+        The requested dates reconstructed from the file names
+
+    Note
+    ----
+    Equivalent to `pysat.instruments.methods.testing.generate_times`, but
+    builds each day of times with vectorized operations.
+
+    """
+
+    daily = [_filename_to_times(fname, num_samples, cadence)
+             for fname in fnames]
+    dates = [date for date, _, _ in daily]
+
+    if len(daily) == 1:
+        _, uts, index = daily[0]
+    else:
+        uts = np.concatenate([day_uts + 86400. * i
+                              for i, (_, day_uts, _) in enumerate(daily)])
+        index = daily[0][2].append([day_index for _, _, day_index
+                                    in daily[1:]])
+
+    return uts, index, dates
+
+
+def _filename_to_times(fname, num_samples, cadence):
+    """Construct one day of times from a simulated instrument file name.
+
+    Parameters
+    ----------
+    fname : str
+        Filename, starting with the date as 'YYYY-MM-DD'.
+    num_samples : int
+        Maximum number of times to generate.  Data points will not go beyond
+        the current day.
+    cadence : str
+        Frequency of temporal output, compatible with pandas.date_range
+
+    Returns
+    -------
+    date : dt.datetime
+        The date reconstructed from the file name
+    uts : np.array
+        Array of seconds since the start of the day for each time
+    index : pds.DatetimeIndex
+        The DatetimeIndex for the day
+
+    """
+
+    # Grab date from filename
+    parts = os.path.split(fname)[-1].split('-')
+    date = dt.datetime(int(parts[0]), int(parts[1]), int(parts[2][0:2]))
+
+    # Limit the number of samples to those within the day
+    step = pds.to_timedelta(pds.tseries.frequencies.to_offset(cadence))
+    num_samples = min(num_samples, pds.Timedelta(seconds=86399) // step + 1)
+
+    index = pds.date_range(start=date, periods=num_samples, freq=cadence)
+    uts = (index - date) / pds.Timedelta(seconds=1)
+    uts = np.asarray(uts, dtype=float)
+
+    return date, uts, index
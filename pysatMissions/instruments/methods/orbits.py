@@ -9,6 +9,11 @@
 import numpy as np
 import warnings
 
+# Planetary radius (km) and mass (kg), and Newton's gravitational constant
+_RADIUS = {'earth': 6371.2}
+_MASS = {'earth': 5.9722e24}
+_GRAVITY = 6.6743e-11
+
 
 def _check_orbital_params(kwargs):
     """Check that a complete set of unconflicted orbital parameters exist.
@@ -21,19 +26,18 @@ def _check_orbital_params(kwargs):
 
     """
 
-    req_elements = list(kwargs['load'].keys())
+    req_elements = set(kwargs['load'].keys())
 
     keplerians = ['alt_periapsis', 'inclination']
     tles = ['tle1', 'tle2']
     errmsg = 'Insufficient kwargs.  Kwarg group requires {:}'
     for group in [tles, keplerians]:
-        bools = [item in req_elements for item in group]
+        provided = req_elements.intersection(group)
 
         # Check if group is incomplete.
-        if any(bools) and not all(bools):
+        if provided and len(provided) < len(group):
             raise KeyError(errmsg.format(', '.join(group)))
-    if (all(item in req_elements for item in tles)
-            and all(item in req_elements for item in keplerians)):
+    if req_elements.issuperset(tles) and req_elements.issuperset(keplerians):
         warnings.warn(' '.join(['Cannot use both Keplerians and TLEs.',
                                 'Defaulting to Keplerians.']))
 
@@ -60,14 +64,10 @@ def _get_constants(planet='earth'):
 
     """
 
-    radius = {'earth': 6371.2}
-    mass = {'earth': 5.9722e24}
-    gravity = 6.6743e-11
-
-    if planet not in radius.keys():
+    if planet not in _RADIUS:
         raise KeyError('{:} is not yet a supported planet!'.format(planet))
 
-    return radius[planet], mass[planet], gravity
+    return _RADIUS[planet], _MASS[planet], _GRAVITY
 
 
 def convert_to_keplerian(alt_periapsis, alt_apoapsis=None, planet='earth'):
@@ -75,9 +75,9 @@ def convert_to_keplerian(alt_periapsis, alt_apoapsis=None, planet='earth'):
 
     Parameters
     ----------
-    alt_periapsis : float
+    alt_periapsis : float or array-like
         The lowest altitude from the mean planet surface along the orbit (km)
-    alt_apoapsis : float or NoneType
+    alt_apoapsis : float, array-like, or NoneType
         The highest altitude from the mean planet surface along the orbit (km)
         If None, assumed to be equal to periapsis. (default=None)
     planet : str
@@ -86,17 +86,26 @@ def convert_to_keplerian(alt_periapsis, alt_apoapsis=None, planet='earth'):
 
     Returns
     -------
-    eccentricity : float
+    eccentricity : float or array-like
         The eccentricty of the orbit (unitless)
-    mean_motion : float
+    mean_motion : float or array-like
         The mean angular speed of the orbit (rad/minute)
 
+    Note
+    ----
+    Array inputs are converted element-wise, allowing many orbits to be
+    converted in a single call.
+
     """
 
     radius, mass, gravity = _get_constants(planet)
     if alt_apoapsis is None:
         alt_apoapsis = alt_periapsis
 
+    # Support lists and other sequences, as well as floats and arrays
+    alt_periapsis = np.asarray(alt_periapsis)
+    alt_apoapsis = np.asarray(alt_apoapsis)
+
     rad_apoapsis = alt_apoapsis + radius
     rad_periapsis = alt_periapsis + radius
     semimajor = 0.5 * (rad_apoapsis + rad_periapsis)
@@ -115,9 +124,9 @@ def convert_from_keplerian(eccentricity, mean_motion, planet='earth'):
 
     Parameters
     ----------
-    eccentricity : float
+    eccentricity : float or array-like
         The eccentricty of the orbit (unitless)
-    mean_motion : float
+    mean_motion : float or array-like
         The mean angular speed of the orbit (rad/minute)
     planet : str
         The name of the planet of interest.  Used for radial calculations.
@@ -125,15 +134,24 @@ def convert_from_keplerian(eccentricity, mean_motion, planet='earth'):
 
     Returns
     -------
-    alt_periapsis : float
+    alt_periapsis : float or array-like
         The lowest altitude from the mean planet surface along the orbit (km)
-    alt_apoapsis : float
+    alt_apoapsis : float or array-like
         The highest altitude from the mean planet surface along the orbit (km)
 
+    Note
+    ----
+    Array inputs are converted element-wise, allowing many orbits to be
+    converted in a single call.
+
     """
 
     radius, mass, gravity = _get_constants(planet)
 
+    # Support lists and other sequences, as well as floats and arrays
+    eccentricity = np.asarray(eccentricity)
+    mean_motion = np.asarray(mean_motion)
+
     # Convert mean_motion to rad / second before computing
     semimajor = (gravity * mass / (mean_motion / 60)**2)
 
@@ -44,6 +44,11 @@ from pysatMissions.instruments import _core as mcore
 from pysatMissions.methods import magcoord as mm_magcoord
 from pysatMissions.methods import spacecraft as mm_sc
 
+# WGS84 semimajor axis (km), flattening, and first eccentricity squared
+_WGS84_SEMIMAJOR = 6378.137
+_WGS84_FLATTENING = 1.0 / 298.257223563
+_WGS84_ECC_SQ = _WGS84_FLATTENING * (2.0 - _WGS84_FLATTENING)
+
 # -------------------------------
 # Required Instrument attributes
 platform = 'missions'
@@ -173,8 +178,8 @@ def load(fnames, tag=None, inst_id=None, obs_long=0., obs_lat=0., obs_alt=0.,
         num_samples = 100
 
     # Extract list of times from filenames and inst_id
-    times, index, dates = ps_meth.generate_times(fnames, num_samples,
-                                                 freq=cadence)
+    times, index, dates = mcore._generate_times(fnames, num_samples,
+                                                cadence=cadence)
 
     # The observer's (ground station) position on the Earth surface
     site = ephem.Observer()
@@ -184,58 +189,84 @@ def load(fnames, tag=None, inst_id=None, obs_long=0., obs_lat=0., obs_alt=0.,
 
     # The first parameter in readtle() is the satellite name
     sat = ephem.readtle('pysat', line1, line2)
-    output_params = []
-    for timestep in index:
-        lp = {}
-        site.date = timestep
+
+    # Fill preallocated arrays rather than building a dict per timestep
+    output = {key: np.empty(len(index))
+              for key in ['glong', 'glat', 'alt', 'obs_sat_az_angle',
+                          'obs_sat_el_angle', 'obs_sat_slant_range']}
+
+    # Precompute dates as floats in PyEphem's Dublin Julian Date convention,
+    # avoiding a datetime conversion inside PyEphem at every timestep
+    ephem_dates = ((index - pds.Timestamp(ephem.Date(0).datetime()))
+                   / pds.Timedelta(days=1)).tolist()
+    for i, ephem_date in enumerate(ephem_dates):
+        site.date = ephem_date
         sat.compute(site)
 
-        # Parameters relative to the ground station
-        lp['obs_sat_az_angle'] = ephem.degrees(sat.az)
-        lp['obs_sat_el_angle'] = ephem.degrees(sat.alt)
+        # Parameters relative to the ground station in radians
+        output['obs_sat_az_angle'][i] = sat.az
+        output['obs_sat_el_angle'][i] = sat.alt
 
         # Total distance between transmitter and receiver
-        lp['obs_sat_slant_range'] = sat.range
-
-        # Satellite location (sub-latitude and sub-longitude)
-        lp['glat'] = np.degrees(sat.sublat)
-        lp['glong'] = np.degrees(sat.sublong)
-
-        # Elevation of satellite in m, converted to km
-        lp['alt'] = sat.elevation / 1000.0
-
-        output_params.append(lp)
-
-    output = pds.DataFrame(output_params, index=index)
-
-    # Get ECEF position of satellite
-    try:
-        output['x'], output['y'], output['z'] = \
-            OMMBV.trans.geodetic_to_ecef(output['glat'], output['glong'],
-                                         output['alt'])
-    except NameError:
-        # Triggered if OMMBV not installed
-        warnings.warn("OMMBV not installed. ECEF coords not generated.",
-                      stacklevel=2)
-        output['x'] = output['glat'] * np.nan
-        output['y'] = output['glat'] * np.nan
-        output['z'] = output['glat'] * np.nan
-
-    # Modify input object to include calculated parameters
-    # Put data into DataFrame
+        output['obs_sat_slant_range'][i] = sat.range
+
+        # Satellite location (sub-latitude and sub-longitude) in radians
+        output['glat'][i] = sat.sublat
+        output['glong'][i] = sat.sublong
+
+        # Elevation of satellite in m
+        output['alt'][i] = sat.elevation
+
+    # Convert altitude from m to km for the full time series at once
+    output['alt'] /= 1000.0
+
+    # PyEphem provides a geocentric sub-latitude, but a geodetic elevation.
+    # Convert the latitude to be geodetic, for consistency with the altitude
+    output['glat'] = _geocentric_to_geodetic(output['glat'], output['alt'])
+
+    # Get ECEF position of satellite from the native radians, then convert
+    # the location to degrees
+    ecef = _geodetic_to_ecef(output['glat'], output['glong'], output['alt'])
+    for key in ['glat', 'glong', 'obs_sat_az_angle', 'obs_sat_el_angle']:
+        output[key] = np.degrees(output[key])
+
+    # Put data into DataFrame, using the final column order.  The arrays are
+    # not used elsewhere, so they do not need to be copied
     data = pds.DataFrame({'glong': output['glong'],
                           'glat': output['glat'],
                           'alt': output['alt'],
-                          'position_ecef_x': output['x'],
-                          'position_ecef_y': output['y'],
-                          'position_ecef_z': output['z'],
+                          'position_ecef_x': ecef[0],
+                          'position_ecef_y': ecef[1],
+                          'position_ecef_z': ecef[2],
                           'obs_sat_az_angle': output['obs_sat_az_angle'],
                           'obs_sat_el_angle': output['obs_sat_el_angle'],
                           'obs_sat_slant_range':
                           output['obs_sat_slant_range']},
-                         index=index)
+                         index=index, copy=False)
     data.index.name = 'Epoch'
 
+    # Metadata is modified by pysat downstream, so return a copy
+    meta = _generate_meta().copy()
+
+    return data, meta
+
+
+@functools.lru_cache(maxsize=1)
+def _generate_meta():
+    """Generate metadata corresponding to variables in the load routine.
+
+    Returns
+    -------
+    meta : pysat.Meta
+        Object containing metadata such as column names and units
+
+    Note
+    ----
+    Cached so the template is only built once per session.  Use a copy of
+    the output, as the cached object must not be modified.
+
+    """
+
     meta = pysat.Meta()
     meta['Epoch'] = {
         meta.labels.units: 'Milliseconds since 1970-1-1',
@@ -287,8 +318,74 @@ def load(fnames, tag=None, inst_id=None, obs_long=0., obs_lat=0., obs_alt=0.,
         meta.labels.max_val: np.inf,
         meta.labels.fill_val: np.nan}
 
-    return data, meta
+    return meta
 
 
 list_files = functools.partial(ps_meth.list_files, test_dates=_test_dates)
 download = functools.partial(ps_meth.download)
+
+
+def _geocentric_to_geodetic(latitude, altitude):
+    """Convert geocentric latitude to WGS84 geodetic latitude.
+
+    Parameters
+    ----------
+    latitude : array-like
+        Geocentric latitude in radians
+    altitude : array-like
+        Geodetic height above the WGS84 ellipsoid in km
+
+    Returns
+    -------
+    array-like
+        Geodetic latitude in radians
+
+    Note
+    ----
+    The geodetic latitude depends on the distance from the ellipsoid, so
+    it is found iteratively, starting from the surface value.  Two iterations
+    converge to well below a millimeter for low Earth orbits.
+
+    """
+
+    tan_lat = np.tan(latitude)
+    geod_lat = np.arctan(tan_lat / (1.0 - _WGS84_ECC_SQ))
+    for _ in range(2):
+        r_n = _WGS84_SEMIMAJOR / np.sqrt(1.0 - _WGS84_ECC_SQ
+                                         * np.sin(geod_lat)**2)
+        geod_lat = np.arctan(tan_lat * (r_n + altitude)
+                             / (r_n * (1.0 - _WGS84_ECC_SQ) + altitude))
+
+    return geod_lat
+
+
+def _geodetic_to_ecef(latitude, longitude, altitude):
+    """Convert WGS84 geodetic coordinates to ECEF position.
+
+    Parameters
+    ----------
+    latitude : array-like
+        Geodetic latitude in radians
+    longitude : array-like
+        Geodetic longitude in radians
+    altitude : array-like
+        Height above the WGS84 ellipsoid in km
+
+    Returns
+    -------
+    x, y, z : array-like
+        ECEF position in km
+
+    """
+
+    sin_lat = np.sin(latitude)
+    cos_lat = np.cos(latitude)
+
+    # Radius of curvature in the prime vertical
+    r_n = _WGS84_SEMIMAJOR / np.sqrt(1.0 - _WGS84_ECC_SQ * sin_lat**2)
+
+    x = (r_n + altitude) * cos_lat * np.cos(longitude)
+    y = (r_n + altitude) * cos_lat * np.sin(longitude)
+    z = (r_n * (1.0 - _WGS84_ECC_SQ) + altitude) * sin_lat
+
+    return x, y, z
@@ -31,6 +31,7 @@ from pysatMissions.instruments import _core as mcore
 from pysatMissions.instruments.methods import orbits
 
 from geospacepy import terrestrial_ellipsoidal as conv_ell
+from geospacepy import sun as geo_sun
 from geospacepy import terrestrial_spherical as conv_sph
 from sgp4 import api as sapi
 
@@ -184,13 +185,13 @@ def load(fnames, tag=None, inst_id=None, tle1=None, tle2=None,
         line2 = tle2
 
     if (num_samples is None) or one_orbit:
-        # Calculate one day of samples for default
-        num_samples = len(pds.date_range('2018/1/1', '2018/1/2',
-                                         freq=cadence)) - 1
+        # Calculate one day of samples for default, without generating times
+        num_samples = pds.Timedelta(days=1) // pds.to_timedelta(
+            pds.tseries.frequencies.to_offset(cadence))
 
     # Extract list of times from filenames and inst_id
-    times, index, dates = ps_meth.generate_times(fnames, num_samples,
-                                                 freq=cadence)
+    times, index, dates = mcore._generate_times(fnames, num_samples,
+                                                cadence=cadence)
     # Calculate epoch for orbital propagator
     epoch_days = (epoch - dt.datetime(1949, 12, 31)).days
     jd, _ = sapi.jday(dates[0].year, dates[0].month, dates[0].day, 0, 0, 0)
@@ -215,7 +216,8 @@ def load(fnames, tag=None, inst_id=None, tle1=None, tle2=None,
         times = times[ind]
         index = index[ind]
 
-    jd = jd * np.ones(len(times))
+    # Propagate all samples in a single call, sharing the day's Julian date
+    jd = np.full(len(times), jd)
     fr = times / 86400.
 
     err_code, position, velocity = satellite.sgp4_array(jd, fr)
@@ -228,8 +230,10 @@ def load(fnames, tag=None, inst_id=None, tle1=None, tle2=None,
 
     # Add ECEF values to instrument.
 
-    pos_ecef = conv_sph.eci2ecef(position, (jd + fr))
-    vel_ecef = conv_sph.eci2ecef(velocity, (jd + fr))
+    # Rotation angle is shared by position and velocity
+    theta_gst = geo_sun.greenwich_mean_siderial_time(jd + fr)
+    pos_ecef = _eci_to_ecef(position, theta_gst)
+    vel_ecef = _eci_to_ecef(velocity, theta_gst)
 
     # Convert to geocentric latitude, longitude, altitude.
     lat, lon, rad = conv_sph.ecef_cart2spherical(pos_ecef)
@@ -260,7 +264,58 @@ def load(fnames, tag=None, inst_id=None, tle1=None, tle2=None,
                          index=index)
     data.index.name = 'Epoch'
 
-    # Create metadata corresponding to variables in load routine
+    # Metadata is modified by pysat downstream, so return a copy
+    meta = _generate_meta().copy()
+
+    return data, meta
+
+
+def _eci_to_ecef(vectors, theta_gst):
+    """Rotate vectors from ECI to ECEF coordinates.
+
+    Parameters
+    ----------
+    vectors : np.array
+        Array of n three component vectors (shape=(n, 3)) in ECI
+    theta_gst : np.array
+        Greenwich Mean Sidereal Time in radians for each vector
+
+    Returns
+    -------
+    np.array
+        Array of n three component vectors (shape=(n, 3)) in ECEF
+
+    Note
+    ----
+    Equivalent to `geospacepy.terrestrial_spherical.eci2ecef`, but rotates
+    all vectors at once rather than building a rotation matrix per vector.
+
+    """
+
+    cos_gst = np.cos(theta_gst)
+    sin_gst = np.sin(theta_gst)
+
+    return np.column_stack((cos_gst * vectors[:, 0] + sin_gst * vectors[:, 1],
+                            cos_gst * vectors[:, 1] - sin_gst * vectors[:, 0],
+                            vectors[:, 2]))
+
+
+@functools.lru_cache(maxsize=1)
+def _generate_meta():
+    """Generate metadata corresponding to variables in the load routine.
+
+    Returns
+    -------
+    meta : pysat.Meta
+        Object containing metadata such as column names and units
+
+    Note
+    ----
+    Cached so the template is only built once per session.  Use a copy of
+    the output, as the cached object must not be modified.
+
+    """
+
     meta = pysat.Meta()
     meta['Epoch'] = {
         meta.labels.units: 'Milliseconds since 1970-1-1',
@@ -347,7 +402,7 @@ def load(fnames, tag=None, inst_id=None, tle1=None, tle2=None,
         meta.labels.max_val: np.inf,
         meta.labels.fill_val: np.nan}
 
-    return data, meta
+    return meta
 
 
 list_files = functools.partial(ps_meth.list_files, test_dates=_test_dates)
@@ -183,16 +183,15 @@ def load(fnames, tag=None, inst_id=None, tle1=None, tle2=None,
         line2 = tle2
 
     if (num_samples is None) or one_orbit:
-        # Calculate one day of samples for default
-        num_samples = len(pds.date_range('2018/1/1', '2018/1/2',
-                                         freq=cadence)) - 1
+        # Calculate one day of samples for default, without generating times
+        num_samples = pds.Timedelta(days=1) // pds.to_timedelta(
+            pds.tseries.frequencies.to_offset(cadence))
 
     # Extract list of times from filenames and inst_id
-    times, index, dates = ps_meth.generate_times(fnames, num_samples,
-                                                 freq=cadence)
+    times, index, dates = mcore._generate_times(fnames, num_samples,
+                                                cadence=cadence)
     # Calculate epoch for orbital propagator
     epoch_days = (epoch - dt.datetime(1949, 12, 31)).days
-    jd, _ = sapi.jday(dates[0].year, dates[0].month, dates[0].day, 0, 0, 0)
 
     if inclination is not None:
         # If an inclination is provided, specify by Keplerian elements
@@ -213,9 +212,13 @@ def load(fnames, tag=None, inst_id=None, tle1=None, tle2=None,
         times = times[ind]
         index = index[ind]
 
-    skytimes = skyapi.load.timescale().from_datetimes(index.tz_localize('UTC'))
+    timescale = _get_timescale()
+    # Offset seconds from the first day as an array, rather than converting
+    # every sample to a timezone-aware datetime
+    skytimes = timescale.utc(dates[0].year, dates[0].month, dates[0].day,
+                             0, 0, times)
 
-    esat = skyapi.EarthSatellite.from_satrec(satrec, skyapi.load.timescale())
+    esat = skyapi.EarthSatellite.from_satrec(satrec, timescale)
     # Generate object with info for all times
     sat_obj = esat.at(skytimes)
     # ECI coords are True Equator and Equinox of date
@@ -249,7 +252,46 @@ def load(fnames, tag=None, inst_id=None, tle1=None, tle2=None,
                          index=index)
     data.index.name = 'Epoch'
 
-    # Create metadata corresponding to variables in load routine
+    # Metadata is modified by pysat downstream, so return a copy
+    meta = _generate_meta().copy()
+
+    return data, meta
+
+
+@functools.lru_cache(maxsize=1)
+def _get_timescale():
+    """Load the skyfield timescale.
+
+    Returns
+    -------
+    timescale : skyfield.timelib.Timescale
+        Timescale used to convert times for skyfield calculations
+
+    Note
+    ----
+    Cached so the timescale data is only loaded once per session.
+
+    """
+
+    return skyapi.load.timescale()
+
+
+@functools.lru_cache(maxsize=1)
+def _generate_meta():
+    """Generate metadata corresponding to variables in the load routine.
+
+    Returns
+    -------
+    meta : pysat.Meta
+        Object containing metadata such as column names and units
+
+    Note
+    ----
+    Cached so the template is only built once per session.  Use a copy of
+    the output, as the cached object must not be modified.
+
+    """
+
     meta = pysat.Meta()
     meta['Epoch'] = {
         meta.labels.units: 'Milliseconds since 1970-1-1',
@@ -314,7 +356,7 @@ def load(fnames, tag=None, inst_id=None, tle1=None, tle2=None,
         meta.labels.max_val: np.inf,
         meta.labels.fill_val: np.nan}
 
-    return data, meta
+    return meta
 
 
 list_files = functools.partial(ps_meth.list_files, test_dates=_test_dates)
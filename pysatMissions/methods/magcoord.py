@@ -6,6 +6,8 @@
 # ----------------------------------------------------------------------------
 """Routines for projecting aacgmv2 and apexpy coords onto pysat instruments."""
 
+import numpy as np
+
 import pysat
 from pysatMissions.utils import package_check
 
@@ -64,20 +66,15 @@ def add_aacgm_coordinates(inst, glat_label='glat', glong_label='glong',
 
     """
 
-    aalat = []
-    aalon = []
-    mlt = []
-    for lat, lon, alt, time in zip(inst[glat_label], inst[glong_label],
-                                   inst[alt_label], inst.data.index):
+    # Fill a preallocated buffer with the latitude, longitude, and MLT
+    aacgm = np.empty((len(inst.data.index), 3))
+    for i, (lat, lon, alt, time) in enumerate(zip(
+            inst[glat_label].to_numpy(), inst[glong_label].to_numpy(),
+            inst[alt_label].to_numpy(), inst.data.index.to_pydatetime())):
         # aacgmv2 latitude and longitude from geodetic coords
-        tlat, tlon, tmlt = aacgmv2.get_aacgm_coord(lat, lon, alt, time)
-        aalat.append(tlat)
-        aalon.append(tlon)
-        mlt.append(tmlt)
+        aacgm[i] = aacgmv2.get_aacgm_coord(lat, lon, alt, time)
 
-    inst['aacgm_lat'] = aalat
-    inst['aacgm_long'] = aalon
-    inst['aacgm_mlt'] = mlt
+    inst[['aacgm_lat', 'aacgm_long', 'aacgm_mlt']] = aacgm
 
     inst.meta['aacgm_lat'] = {'units': 'degrees',
                               'long_name': 'AACGM latitude'}
@@ -129,20 +126,14 @@ def add_quasi_dipole_coordinates(inst, glat_label='glat', glong_label='glong',
 
     ap = apexpy.Apex(date=inst.date)
 
-    qd_lat = []
-    qd_lon = []
-    mlt = []
-    for lat, lon, alt, time in zip(inst[glat_label], inst[glong_label],
-                                   inst[alt_label], inst.data.index):
-        # Quasi-dipole latitude and longitude from geodetic coords
-        tlat, tlon = ap.geo2qd(lat, lon, alt)
-        qd_lat.append(tlat)
-        qd_lon.append(tlon)
-        mlt.append(ap.mlon2mlt(tlon, time))
-
-    inst['qd_lat'] = qd_lat
-    inst['qd_long'] = qd_lon
-    inst['mlt'] = mlt
+    # Quasi-dipole latitude and longitude from geodetic coords, converting
+    # all points at once
+    qd_lat, qd_lon = ap.geo2qd(inst[glat_label].to_numpy(),
+                               inst[glong_label].to_numpy(),
+                               inst[alt_label].to_numpy())
+    mlt = ap.mlon2mlt(qd_lon, inst.data.index.values)
+
+    inst[['qd_lat', 'qd_long', 'mlt']] = np.column_stack((qd_lat, qd_lon, mlt))
 
     inst.meta['qd_lat'] = {'units': 'degrees',
                            'long_name': 'Quasi dipole latitude'}
@@ -39,35 +39,36 @@ def add_ram_pointing_sc_attitude_vectors(inst):
 
     """
 
+    # Work with raw arrays, rather than reading and writing columns per step
+    vel = _stack_variables(inst, ['velocity_ecef_x', 'velocity_ecef_y',
+                                  'velocity_ecef_z'])
+    pos = _stack_variables(inst, ['position_ecef_x', 'position_ecef_y',
+                                  'position_ecef_z'])
+
     # Ram pointing is along velocity vector
-    inst[['sc_xhat_ecef_x', 'sc_xhat_ecef_y', 'sc_xhat_ecef_z']] = normalize(
-        inst[['velocity_ecef_x', 'velocity_ecef_y', 'velocity_ecef_z']])
+    xhat = normalize(vel)
 
     # Begin with z along Nadir (towards Earth)
     # if orbit isn't perfectly circular, then the s/c z vector won't
     # point exactly along nadir. However, nadir pointing is close enough
     # to the true z (in the orbital plane) that we can use it to get y,
     # and use x and y to get the real z
-    inst[['sc_zhat_ecef_x', 'sc_zhat_ecef_y', 'sc_zhat_ecef_z']] = normalize(
-        -inst[['position_ecef_x', 'position_ecef_y', 'position_ecef_z']])
+    zhat = normalize(-pos)
 
     # get y vector assuming right hand rule
     # Z x X = Y
-    inst[['sc_yhat_ecef_x', 'sc_yhat_ecef_y', 'sc_yhat_ecef_z']] = np.cross(
-        inst[['sc_zhat_ecef_x', 'sc_zhat_ecef_y', 'sc_zhat_ecef_z']],
-        inst[['sc_xhat_ecef_x', 'sc_xhat_ecef_y', 'sc_xhat_ecef_z']],
-        axis=1)
     # Normalize since Xhat and Zhat from above may not be orthogonal
-    inst[['sc_yhat_ecef_x', 'sc_yhat_ecef_y', 'sc_yhat_ecef_z']] = normalize(
-        inst[['sc_yhat_ecef_x', 'sc_yhat_ecef_y', 'sc_yhat_ecef_z']])
+    yhat = normalize(np.cross(zhat, xhat, axis=1))
 
     # Strictly, need to recalculate Zhat so that it is consistent with RHS
     # just created
     # Z = X x Y
-    inst[['sc_zhat_ecef_x', 'sc_zhat_ecef_y', 'sc_zhat_ecef_z']] = np.cross(
-        inst[['sc_xhat_ecef_x', 'sc_xhat_ecef_y', 'sc_xhat_ecef_z']],
-        inst[['sc_yhat_ecef_x', 'sc_yhat_ecef_y', 'sc_yhat_ecef_z']],
-        axis=1)
+    zhat = np.cross(xhat, yhat, axis=1)
+
+    # Assign all attitude vectors
+    _assign_variables(inst, ['sc_{:}hat_ecef_{:}'.format(v, u)
+                             for v in ['x', 'y', 'z'] for u in ['x', 'y', 'z']],
+                      np.hstack((xhat, yhat, zhat)))
 
     # Adding metadata
     for v in ['x', 'y', 'z']:
@@ -81,13 +82,12 @@ def add_ram_pointing_sc_attitude_vectors(inst):
                     'expressed in ECEF basis, {:}-component'.format(u)))}
 
     # Check what magnitudes we get
-    mag = np.linalg.norm(
-        inst[['sc_zhat_ecef_x', 'sc_zhat_ecef_y', 'sc_zhat_ecef_z']],
-        axis=1)
-    idx, = np.where(np.abs(mag - 1) > 1e-9)
-    if len(idx) > 0:
-        raise RuntimeError(' '.join(('Unit vector generation failure for ,'
-                                     '{:} points. Not'.format(len(idx)),
+    mag = np.linalg.norm(zhat, axis=1)
+    bad_mag = np.abs(mag - 1.) > 1e-9
+    if bad_mag.any():
+        raise RuntimeError(' '.join(('Unit vector generation failure for',
+                                     '{:} points. Not'.format(
+                                         np.count_nonzero(bad_mag)),
                                      'sufficently orthogonal.')))
 
     return
@@ -123,17 +123,15 @@ def calculate_ecef_velocity(inst):
                             "Use `geospacepy` or `skyfield` instead.")),
                   DeprecationWarning, stacklevel=2)
 
-    def get_vel_from_pos(x):
-        vel = (x.values[2:] - x.values[0:-2]) / 2.
-        return vel
+    # Symmetric difference of all position components in a single pass
+    pos = _stack_variables(inst, ['position_ecef_x', 'position_ecef_y',
+                                  'position_ecef_z'])
+    vel = np.full(pos.shape, np.nan)
+    vel[1:-1] = (pos[2:] - pos[:-2]) / 2.
 
-    vel_x = get_vel_from_pos(inst['position_ecef_x'])
-    vel_y = get_vel_from_pos(inst['position_ecef_y'])
-    vel_z = get_vel_from_pos(inst['position_ecef_z'])
-
-    inst[1:-1, 'velocity_ecef_x'] = vel_x
-    inst[1:-1, 'velocity_ecef_y'] = vel_y
-    inst[1:-1, 'velocity_ecef_z'] = vel_z
+    # Assign full variables, rather than label-slicing each component
+    _assign_variables(inst, ['velocity_ecef_x', 'velocity_ecef_y',
+                             'velocity_ecef_z'], vel)
 
     for v in ['x', 'y', 'z']:
         inst.meta['velocity_ecef_{:}'.format(v)] = {
@@ -174,24 +172,15 @@ def project_ecef_vector_onto_sc(inst, x_label, y_label, z_label,
 
     # TODO(#65): add checks for existence of ECEF variables in the Instrument
 
-    xx = inst['sc_xhat_ecef_x']
-    xy = inst['sc_xhat_ecef_y']
-    xz = inst['sc_xhat_ecef_z']
-
-    yx = inst['sc_yhat_ecef_x']
-    yy = inst['sc_yhat_ecef_y']
-    yz = inst['sc_yhat_ecef_z']
+    # Stack the attitude unit vectors into an (n, 3, 3) basis, with one
+    # attitude vector per row, and project all samples at once
+    basis = _stack_variables(inst, ['sc_{:}hat_ecef_{:}'.format(v, u)
+                                    for v in ['x', 'y', 'z']
+                                    for u in ['x', 'y', 'z']]).reshape(-1, 3, 3)
+    vector = _stack_variables(inst, [x_label, y_label, z_label])
 
-    zx = inst['sc_zhat_ecef_x']
-    zy = inst['sc_zhat_ecef_y']
-    zz = inst['sc_zhat_ecef_z']
-
-    inst[new_x_label] = inst[x_label] * xx + inst[y_label] * xy + inst[
-        z_label] * xz
-    inst[new_y_label] = inst[x_label] * yx + inst[y_label] * yy + inst[
-        z_label] * yz
-    inst[new_z_label] = inst[x_label] * zx + inst[y_label] * zy + inst[
-        z_label] * zz
+    _assign_variables(inst, [new_x_label, new_y_label, new_z_label],
+                      np.einsum('nij,nj->ni', basis, vector))
 
     if meta is not None:
         inst.meta[new_x_label] = meta[0]
@@ -206,16 +195,57 @@ def normalize(vector):
 
     Parameters
     ----------
-    vector : pds.DataFrame
-        A time-series consisting of vector components at each time step.
+    vector : pds.DataFrame or np.array
+        A time-series consisting of vector components at each time step, with
+        one row per time step.
 
     Returns
     -------
-    norm_vector : pds.DataFrame
-        The normalized version of vector
+    norm_vector : pds.DataFrame or np.array
+        The normalized version of vector, of the same type as the input
 
     """
 
-    norm_vector = vector.div(np.linalg.norm(vector, axis=1), axis=0)
+    norm_vector = vector / np.linalg.norm(vector, axis=1)[:, np.newaxis]
 
     return norm_vector
+
+
+def _stack_variables(inst, labels):
+    """Stack Instrument variables into a single array.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument object, with either pandas or xarray data
+    labels : list
+        Names of the one-dimensional variables to stack
+
+    Returns
+    -------
+    np.array
+        Array with one column per variable (shape=(n, len(labels)))
+
+    """
+
+    return np.column_stack([inst[label].values for label in labels])
+
+
+def _assign_variables(inst, labels, values):
+    """Assign the columns of an array to Instrument variables.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument object, with either pandas or xarray data
+    labels : list
+        Names of the variables to assign
+    values : np.array
+        Array with one column per variable (shape=(n, len(labels)))
+
+    """
+
+    for label, column in zip(labels, values.T):
+        inst[label] = column
+
+    return
@@ -0,0 +1,63 @@
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.3475498
+#
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Unit tests for the deferred subpackage imports in pysatMissions."""
+
+import subprocess
+import sys
+
+import pytest
+
+import pysatMissions
+
+
+class TestLazyImport(object):
+    """Unit tests for importing the pysatMissions subpackages on access."""
+
+    def test_bare_import(self):
+        """Test that subpackages are only imported on first access."""
+
+        # Run in a new interpreter, as the tests have already imported the
+        # subpackages in this one
+        code = '; '.join([
+            "import sys",
+            "import pysatMissions",
+            "assert 'pysatMissions.instruments' not in sys.modules",
+            "inst = pysatMissions.instruments",
+            "assert inst is sys.modules['pysatMissions.instruments']"])
+        subprocess.run([sys.executable, '-c', code], check=True)
+        return
+
+    @pytest.mark.parametrize("name", pysatMissions.__all__)
+    def test_getattr(self, name):
+        """Test that each subpackage resolves to the imported module.
+
+        Parameters
+        ----------
+        name : str
+            Name of the subpackage.
+
+        """
+
+        module = pysatMissions.__getattr__(name)
+        assert module is sys.modules['.'.join(('pysatMissions', name))]
+        return
+
+    def test_getattr_unknown(self):
+        """Test that an unknown attribute raises the standard error."""
+
+        with pytest.raises(AttributeError) as aerr:
+            pysatMissions.nothing
+
+        assert str(aerr).find(
+            "module 'pysatMissions' has no attribute 'nothing'") >= 0
+        return
+
+    def test_dir(self):
+        """Test that the subpackages are listed before they are imported."""
+
+        assert set(pysatMissions.__all__).issubset(dir(pysatMissions))
+        return
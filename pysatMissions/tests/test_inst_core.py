@@ -0,0 +1,38 @@
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.3475498
+#
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Unit tests for `pysatMissions.instruments._core`."""
+
+import numpy as np
+
+from pysat.instruments.methods import testing as ps_meth
+from pysatMissions.instruments import _core as mcore
+
+import pytest
+
+
+class TestGenerateTimes(object):
+    """Unit tests for generating times for simulated instruments."""
+
+    @pytest.mark.parametrize("fnames, num_samples, cadence",
+                             [(['2009-01-01.nofile'], 86400, '1S'),
+                              (['2009-01-01.nofile'], 5, '1min'),
+                              (['2009-01-01.nofile'], 100000, '7S'),
+                              (['2009-01-01.nofile', '2009-01-02.nofile'],
+                               100, '10S')])
+    def test_generate_times(self, fnames, num_samples, cadence):
+        """Test that times match the pysat testing method."""
+
+        uts, index, dates = mcore._generate_times(fnames, num_samples,
+                                                  cadence=cadence)
+        ps_uts, ps_index, ps_dates = ps_meth.generate_times(fnames,
+                                                            num_samples,
+                                                            freq=cadence)
+        assert np.array_equal(uts, ps_uts)
+        assert uts.flags.writeable
+        assert index.equals(ps_index)
+        assert dates == ps_dates
+        return
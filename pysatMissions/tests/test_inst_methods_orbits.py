@@ -6,6 +6,8 @@
 # ----------------------------------------------------------------------------
 """Unit tests for `pysatMissions.instruments.methods.orbits`."""
 
+import numpy as np
+
 import pysatMissions.instruments.methods.orbits as mm_orbits
 
 import pytest
@@ -61,3 +63,28 @@ class TestBasics(object):
         self.eval_output(per, 'perigee')
         self.eval_output(apo, 'apogee')
         return
+
+    @pytest.mark.parametrize("array_type", [np.array, list])
+    def test_convert_keplerian_array(self, array_type):
+        """Test that conversions of array inputs match scalar conversions.
+
+        Parameters
+        ----------
+        array_type : type
+            Function used to build the array-like inputs.
+
+        """
+
+        perigees = array_type([self.orbit['perigee'], 500., 600.])
+        apogees = array_type([self.orbit['apogee'], 500., 1200.])
+        ecc, mm, = mm_orbits.convert_to_keplerian(perigees, apogees)
+        for i in range(len(perigees)):
+            np.testing.assert_allclose(
+                [ecc[i], mm[i]],
+                mm_orbits.convert_to_keplerian(perigees[i], apogees[i]))
+
+        per, apo, = mm_orbits.convert_from_keplerian(array_type(ecc),
+                                                     array_type(mm))
+        np.testing.assert_allclose(per, perigees)
+        np.testing.assert_allclose(apo, apogees)
+        return
@@ -16,6 +16,7 @@ import datetime as dt
 import numpy as np
 import warnings
 
+import pysat
 import pytest
 
 # Make sure to import your instrument package here:
@@ -217,3 +218,60 @@ class TestInstruments(clslib.InstLibTests):
         assert UserWarning in categories
 
         return
+
+    def test_ephem_ecef_consistency(self):
+        """Test that ephem and sgp4 ECEF positions agree for the same TLE."""
+
+        tles = {'tle1': ''.join(('1 25544U 98067A   18135.61844383  .00002728 ',
+                                 ' 00000-0  48567-4 0  9998')),
+                'tle2': ''.join(('2 25544  51.6402 181.0633 0004018  88.8954 ',
+                                 ' 22.2246 15.54059185113452'))}
+        date = dt.datetime(2018, 5, 15)
+
+        with warnings.catch_warnings():
+            # Ignore the deprecation warning for the ephem instrument
+            warnings.simplefilter('ignore', DeprecationWarning)
+            ephem_inst = pysat.Instrument(
+                inst_module=pysatMissions.instruments.missions_ephem,
+                num_samples=1000, cadence='60s', **tles)
+            ephem_inst.load(date=date)
+
+        sgp4_inst = pysat.Instrument(
+            inst_module=pysatMissions.instruments.missions_sgp4,
+            num_samples=1000, cadence='60s', **tles)
+        sgp4_inst.load(date=date)
+
+        # The propagators and Earth rotation models differ slightly, so the
+        # positions are only expected to agree to within a kilometer
+        for coord in ['x', 'y', 'z']:
+            var = 'position_ecef_{:}'.format(coord)
+            np.testing.assert_allclose(ephem_inst[var], sgp4_inst[var],
+                                       rtol=0, atol=1.0)
+
+        return
+
+    def test_ephem_angles_in_degrees(self):
+        """Test that the ephem azimuth and elevation angles are in degrees."""
+
+        with warnings.catch_warnings():
+            # Ignore the deprecation warning for the ephem instrument
+            warnings.simplefilter('ignore', DeprecationWarning)
+            self.test_inst = pysat.Instrument(
+                inst_module=pysatMissions.instruments.missions_ephem,
+                num_samples=1440, cadence='60s')
+            self.test_inst.load(date=dt.datetime(2018, 5, 15))
+
+        # Over a day the angles cover ranges only possible in degrees
+        az = self.test_inst['obs_sat_az_angle']
+        assert np.all((az >= 0.) & (az <= 360.))
+        assert az.max() - az.min() > 2. * np.pi
+
+        el = self.test_inst['obs_sat_el_angle']
+        assert np.all((el >= -90.) & (el <= 90.))
+        assert el.max() - el.min() > np.pi
+
+        for var in ['obs_sat_az_angle', 'obs_sat_el_angle']:
+            assert self.test_inst.meta[var, self.test_inst.meta.labels.units] \
+                == 'degrees'
+
+        return
@@ -11,6 +11,7 @@ import datetime as dt
 import numpy as np
 import warnings
 
+import pandas as pds
 import pysat
 from pysatMissions.methods import spacecraft as mm_sc
 
@@ -76,6 +77,18 @@ class TestBasics(object):
                 "{:s} not found in metadata".format(target)
         return
 
+    def test_normalize(self):
+        """Test `normalize` for array and DataFrame inputs."""
+
+        vector = np.array([[3.0, 4.0, 0.0], [0.0, 0.0, 2.0]])
+        target = np.array([[0.6, 0.8, 0.0], [0.0, 0.0, 1.0]])
+        np.testing.assert_allclose(mm_sc.normalize(vector), target)
+
+        norm_frame = mm_sc.normalize(pds.DataFrame(vector))
+        assert isinstance(norm_frame, pds.DataFrame)
+        np.testing.assert_allclose(norm_frame, target)
+        return
+
     def test_calculate_ecef_velocity(self):
         """Test `calculate_ecef_velocity` helper function."""
 
@@ -143,3 +156,17 @@ class TestBasics(object):
         assert np.all(self.testInst['by'] == [0.0, 0.0, 1.0, 0.0, 0.0, -1.0])
         assert np.all(self.testInst['bz'] == [0.0, 0.0, 0.0, -1.0, -1.0, 0.0])
         return
+
+
+class TestBasicsNDXarray(TestBasics):
+    """Unit tests for spacecraft methods using an xarray Instrument."""
+
+    def setup_method(self):
+        """Create a clean testing setup before each method."""
+
+        self.testInst = pysat.Instrument(platform='pysat', name='ndtesting',
+                                         num_samples=6, clean_level='clean',
+                                         use_header=True)
+        self.testInst.custom_attach(add_ecef)
+        self.reftime = dt.datetime(2009, 1, 1)
+        return
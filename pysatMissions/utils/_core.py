@@ -13,7 +13,7 @@ import warnings
 def package_check(package_name):
     """Throw a warning if optional package is not installed.
 
-    Some systems are having issues installing OMMBV and apexpy.
+    Some systems are having issues installing apexpy.
     This allows these packages to be optionally installed.
 
     Parameters